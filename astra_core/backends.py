@@ -0,0 +1,147 @@
+"""
+Decision backends for Gemini-Astra.
+
+Backends are selected by name ("live", "local", "rules"), either
+explicitly or through the ASTRA_BACKEND environment variable.
+The Gemini SDK is imported on the first live decision, so importing
+this module costs only stdlib imports.
+"""
+
+import os
+import json
+
+from astra_core.constraints import violated_constraints
+from astra_core.decision import parse_decision, safe_decision, validate_decision
+
+DEFAULT_BACKEND = "live"
+GEMINI_MODEL = "gemini-3.0"
+
+
+class GeminiBackend:
+    """
+    Live backend: asks Gemini 3 for a decision.
+
+    The SDK import and client construction happen on first use.
+    """
+
+    name = "live"
+
+    def __init__(self, model=GEMINI_MODEL):
+        self.model = model
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            api_key = os.getenv("GOOGLE_API_KEY")
+            if not api_key:
+                return None
+            from google import genai
+
+            self._client = genai.Client(api_key=api_key)
+        return self._client
+
+    def decide(self, state: dict) -> dict:
+        """Call the real Gemini 3 AI for decision making."""
+        client = self._get_client()
+        if client is None:
+            print("❌ ERROR: API key not found! Set it with export GOOGLE_API_KEY='...'")
+            return safe_decision("No API Key")
+
+        # Prompt instructs AI to act as the onboard computer
+        prompt = f"""
+    You are the ASTRA-01 Satellite AI. Analyze this telemetry and choose the best action.
+    Return ONLY a JSON object: {{"action": "...", "reason": "...", "confidence": ...}}
+
+    Actions: 'ACTIVATE_COOLING', 'REDEPLOY_PANELS', 'NO_ACTION'.
+
+    Current State: {json.dumps(state)}
+    """
+
+        try:
+            response = client.models.generate_content(
+                model=self.model,
+                contents=prompt
+            )
+            return parse_decision(response.text)
+        except Exception as e:
+            print(f"⚠️ AI Error: {e}. Falling back to safe mode.")
+            return safe_decision("AI Error")
+
+
+class LocalBackend:
+    """
+    Local stand-in: replays recorded model responses from a JSON file.
+
+    The file holds a list of raw responses (strings or objects), which
+    go through the same parsing as live output. Once exhausted, the
+    backend answers NO_ACTION.
+    """
+
+    name = "local"
+
+    def __init__(self, responses_path=None):
+        self.responses_path = responses_path or os.getenv("ASTRA_LOCAL_RESPONSES")
+        if not self.responses_path:
+            raise ValueError("Local backend requires ASTRA_LOCAL_RESPONSES or a responses path")
+        self._responses = None
+
+    def decide(self, state: dict) -> dict:
+        if self._responses is None:
+            with open(self.responses_path, "r", encoding="utf-8") as f:
+                self._responses = list(json.load(f))
+
+        if not self._responses:
+            return safe_decision("Local responses exhausted")
+
+        raw = self._responses.pop(0)
+        if isinstance(raw, str):
+            return parse_decision(raw)
+        return validate_decision(raw)
+
+
+class RuleBackend:
+    """
+    Rule-only backend: deterministic decisions from scenario constraints.
+
+    No model involved; useful offline and as a baseline.
+    """
+
+    name = "rules"
+
+    # Constraint -> corrective action, in check order
+    ACTIONS = {
+        "max_cpu_temperature": ("ACTIVATE_COOLING", "CPU temperature above limit"),
+        "min_power_output": ("REDEPLOY_PANELS", "Power output below limit"),
+        "min_battery_charge": ("POWER_SAVE_MODE", "Battery charge below limit"),
+    }
+
+    def decide(self, state: dict) -> dict:
+        for constraint in violated_constraints(state):
+            action, reason = self.ACTIONS[constraint]
+            return {"action": action, "reason": reason, "confidence": 1.0}
+
+        return {"action": "NO_ACTION", "reason": "All constraints satisfied", "confidence": 1.0}
+
+
+BACKENDS = {
+    GeminiBackend.name: GeminiBackend,
+    LocalBackend.name: LocalBackend,
+    RuleBackend.name: RuleBackend,
+}
+
+
+def get_backend(name: str | None = None, **kwargs):
+    """
+    Build a decision backend by name.
+
+    Args:
+        name (str | None): Backend name; defaults to ASTRA_BACKEND, then "live".
+        **kwargs: Passed to the backend constructor (e.g. responses_path for "local").
+
+    Returns:
+        Backend instance exposing decide(state) -> dict.
+    """
+    name = name or os.getenv("ASTRA_BACKEND", DEFAULT_BACKEND)
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    return BACKENDS[name](**kwargs)
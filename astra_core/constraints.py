@@ -0,0 +1,37 @@
+"""
+Safety constraint checks for Gemini-Astra.
+
+Shared by the simulator and the rule-only backend so both judge
+telemetry the same way. Stdlib only.
+"""
+
+
+def violated_constraints(state: dict) -> list[str]:
+    """
+    Compare telemetry against the scenario's safety constraints.
+
+    Args:
+        state (dict): Scenario state with "telemetry" and "constraints".
+
+    Returns:
+        list[str]: Names of violated constraints, in check order.
+    """
+    constraints = state.get("constraints", {})
+    telemetry = state.get("telemetry", {})
+    thermal = telemetry.get("thermal", {})
+
+    violated = []
+
+    if "max_cpu_temperature" in constraints:
+        if thermal.get("cpu_temperature", 0) > constraints["max_cpu_temperature"]:
+            violated.append("max_cpu_temperature")
+
+    if "min_power_output" in constraints:
+        if telemetry.get("power_output", 0) < constraints["min_power_output"]:
+            violated.append("min_power_output")
+
+    if "min_battery_charge" in constraints:
+        if telemetry.get("battery_charge", 0) < constraints["min_battery_charge"]:
+            violated.append("min_battery_charge")
+
+    return violated
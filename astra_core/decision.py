@@ -0,0 +1,73 @@
+"""
+Decision validation for Gemini-Astra.
+
+Every decision, whichever backend produced it, passes through here
+before it reaches the simulator. Stdlib only.
+"""
+
+import json
+
+# Commands the simulator knows how to execute
+VALID_ACTIONS = {
+    "ACTIVATE_COOLING",
+    "ENTER_DEGRADED_MODE",
+    "REDEPLOY_PANELS",
+    "POWER_SAVE_MODE",
+    "NO_ACTION",
+}
+
+
+def safe_decision(reason: str) -> dict:
+    """Return the fallback decision used whenever a backend fails."""
+    return {"action": "NO_ACTION", "reason": reason, "confidence": 0}
+
+
+def validate_decision(decision) -> dict:
+    """
+    Validate a decision dictionary against the action whitelist.
+
+    Args:
+        decision: Decision produced by a backend.
+
+    Returns:
+        dict: The decision, or a safe NO_ACTION decision if it is invalid.
+    """
+    if not isinstance(decision, dict):
+        return safe_decision("Malformed decision")
+
+    action = decision.get("action")
+    if action not in VALID_ACTIONS:
+        return safe_decision(f"Rejected unknown action: {action}")
+
+    return decision
+
+
+def parse_decision(raw_text: str) -> dict:
+    """
+    Parse raw model output into a validated decision dictionary.
+
+    Args:
+        raw_text (str): Model response, optionally wrapped in ```json fences.
+
+    Returns:
+        dict: Validated decision.
+    """
+    clean_json = raw_text.replace("```json", "").replace("```", "").strip()
+    try:
+        decision = json.loads(clean_json)
+    except json.JSONDecodeError:
+        return safe_decision("Unparseable response")
+    return validate_decision(decision)
+
+
+if __name__ == "__main__":
+    # Self-check of the safety gate: python3 -m astra_core.decision
+    fenced = '```json\n{"action": "ACTIVATE_COOLING", "reason": "hot", "confidence": 0.9}\n```'
+    assert parse_decision(fenced)["action"] == "ACTIVATE_COOLING"
+    assert parse_decision('{"action": "SELF_DESTRUCT"}')["action"] == "NO_ACTION"
+    assert parse_decision("not json")["reason"] == "Unparseable response"
+    assert parse_decision('["ACTIVATE_COOLING"]')["reason"] == "Malformed decision"
+    assert validate_decision(None)["action"] == "NO_ACTION"
+    assert validate_decision({"reason": "no action"})["action"] == "NO_ACTION"
+    assert validate_decision({"action": "NO_ACTION"}) == {"action": "NO_ACTION"}
+    print("✅ Decision validation self-check passed")
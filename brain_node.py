@@ -8,8 +8,6 @@ import os
 import sys
 import json
 import logging
-from google import genai
-from google.genai import types
 
 # ----------------------------------------
 # Python version check
@@ -23,14 +21,26 @@ if sys.version_info < (3, 12):
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
 # ----------------------------------------
-# Initialize Gemini Client securely
+# Gemini Client (created on first use)
 # ----------------------------------------
-API_KEY = os.getenv("GOOGLE_API_KEY")
-if not API_KEY:
-    raise EnvironmentError("Please set the GOOGLE_API_KEY environment variable")
+_client = None
 
-client = genai.Client(api_key=API_KEY, http_options={"api_version": "v1beta"})
-logging.info("✅ Gemini client initialized")
+
+def get_client():
+    """
+    Returns the shared Gemini client, importing the SDK on first call.
+    """
+    global _client
+    if _client is None:
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            raise EnvironmentError("Please set the GOOGLE_API_KEY environment variable")
+
+        from google import genai
+
+        _client = genai.Client(api_key=api_key, http_options={"api_version": "v1beta"})
+        logging.info("✅ Gemini client initialized")
+    return _client
 
 # ----------------------------------------
 # Valid keys for output validation
@@ -44,8 +54,11 @@ def get_astral_decision(telemetry_json: str) -> dict:
     """
     Sends telemetry to Gemini and returns a validated decision dictionary.
     """
+    response = None
     try:
-        response = client.models.generate_content(
+        from google.genai import types
+
+        response = get_client().models.generate_content(
             model="gemini-2.0-flash",
             config=types.GenerateContentConfig(
                 system_instruction=(
@@ -108,6 +121,9 @@ if __name__ == "__main__":
             "temp": "45C"
         }
 
+    # Fail fast on missing credentials, before command.json is written
+    get_client()
+
     logging.info("🚀 Sending telemetry to Gemini AI core...")
     decision = get_astral_decision(json.dumps(telemetry_data))
 
@@ -3,7 +3,8 @@ import json
 import time
 import datetime
 from simulator.simulator import SpaceSimulator
-from google import genai  # Gemini 3 AI
+from astra_core.backends import BACKENDS, DEFAULT_BACKEND, get_backend
+from astra_core.decision import validate_decision
 
 MAX_STEPS = 10
 LOOP_DELAY = 1.5  # seconds
@@ -23,39 +24,17 @@ def is_critical_failure(state):
     return state["telemetry"]["status"] == "CRITICAL"
 
 
-def real_gemini_decision(state):
-    """Call the real Gemini 3 AI for decision making."""
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        print("❌ ERROR: API key not found! Set it with export GOOGLE_API_KEY='...'")
-        return {"action": "NO_ACTION", "reason": "No API Key", "confidence": 0}
-
-    client = genai.Client(api_key=api_key)
-
-    # Prompt instructs AI to act as the onboard computer
-    prompt = f"""
-    You are the ASTRA-01 Satellite AI. Analyze this telemetry and choose the best action.
-    Return ONLY a JSON object: {{"action": "...", "reason": "...", "confidence": ...}}
-
-    Actions: 'ACTIVATE_COOLING', 'REDEPLOY_PANELS', 'NO_ACTION'.
-
-    Current State: {json.dumps(state)}
+def run_autonomous_mission_loop(scenario_file, backend=None):
     """
+    Run the mission loop for a given scenario file.
 
-    try:
-        response = client.models.generate_content(
-            model="gemini-3.0",
-            contents=prompt
-        )
-        clean_json = response.text.replace('```json', '').replace('```', '').strip()
-        return json.loads(clean_json)
-    except Exception as e:
-        print(f"⚠️ AI Error: {e}. Falling back to safe mode.")
-        return {"action": "NO_ACTION", "reason": "AI Error", "confidence": 0}
-
+    Args:
+        scenario_file (str): Path to scenario JSON file.
+        backend: Decision backend, or a backend name (see astra_core.backends).
+    """
+    if backend is None or isinstance(backend, str):
+        backend = get_backend(backend)
 
-def run_autonomous_mission_loop(scenario_file):
-    """Run the mission loop for a given scenario file."""
     sim = SpaceSimulator()
     state = sim.load_scenario(scenario_file)
 
@@ -70,8 +49,8 @@ def run_autonomous_mission_loop(scenario_file):
         telemetry = state["telemetry"]
         print(f"📡 Telemetry: CPU={telemetry.get('cpu_temperature')} | Power={telemetry.get('power_output')} | Status={telemetry['status']}")
 
-        # 2. THINK (Gemini 3)
-        ai_decision = real_gemini_decision(state)
+        # 2. THINK (Gemini 3 or configured backend)
+        ai_decision = validate_decision(backend.decide(state))
         ai_action = ai_decision["action"]
         reason = ai_decision.get("reason", "N/A")
         confidence = ai_decision.get("confidence", 1.0)
@@ -145,7 +124,43 @@ def run_autonomous_mission_loop(scenario_file):
 
 
 if __name__ == "__main__":
-    # Run both scenarios sequentially
-    run_autonomous_mission_loop("simulator/scenarios/thermal_overheat.json")
-    run_autonomous_mission_loop("simulator/scenarios/solar_failure.json")
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gemini-Astra Mission Loop")
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        default=["simulator/scenarios/thermal_overheat.json", "simulator/scenarios/solar_failure.json"],
+        help="Scenario JSON files to run (default: both bundled scenarios)"
+    )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=sorted(BACKENDS),
+        default=None,
+        help="Decision backend (default: $ASTRA_BACKEND or live)"
+    )
+    parser.add_argument(
+        "--responses",
+        type=str,
+        default=None,
+        help="Recorded responses JSON for the local backend (default: $ASTRA_LOCAL_RESPONSES)"
+    )
+    args = parser.parse_args()
+
+    backend_name = args.backend or os.getenv("ASTRA_BACKEND", DEFAULT_BACKEND)
+    if backend_name not in BACKENDS:
+        parser.error(f"ASTRA_BACKEND: invalid choice: '{backend_name}' (choose from {', '.join(sorted(BACKENDS))})")
+
+    backend_kwargs = {}
+    if backend_name == "local":
+        responses = args.responses or os.getenv("ASTRA_LOCAL_RESPONSES")
+        if not responses:
+            parser.error("--backend local requires --responses or ASTRA_LOCAL_RESPONSES")
+        backend_kwargs["responses_path"] = responses
+
+    # Run scenarios sequentially
+    backend = get_backend(backend_name, **backend_kwargs)
+    for scenario in args.scenarios:
+        run_autonomous_mission_loop(scenario, backend)
 
@@ -2,6 +2,8 @@ import json
 import os
 from copy import deepcopy
 
+from astra_core.constraints import violated_constraints
+
 
 class SpaceSimulator:
     """
@@ -125,19 +127,7 @@ class SpaceSimulator:
         Returns:
             bool: True if all constraints are satisfied.
         """
-        constraints = self.current_state.get("constraints", {})
-        telemetry = self.current_state.get("telemetry", {})
-        thermal = telemetry.get("thermal", {})
-
-        if "max_cpu_temperature" in constraints:
-            if thermal.get("cpu_temperature", 0) > constraints["max_cpu_temperature"]:
-                return False
-
-        if "min_battery_charge" in constraints:
-            if telemetry.get("battery_charge", 0) < constraints["min_battery_charge"]:
-                return False
-
-        return True
+        return not violated_constraints(self.current_state)
 
     def get_state(self) -> dict:
         """Return current simulator state."""
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Gemini-Astra Startup Budget
+Measures import time of the headless core with `-X importtime`
+and fails when a module exceeds the startup budget.
+"""
+
+import os
+import sys
+import subprocess
+
+# Modules every short-lived CLI / ROS launch pays for
+CORE_MODULES = [
+    "simulator.simulator",
+    "astra_core.decision",
+    "astra_core.backends",
+    "run_mission",
+    "brain_node",
+]
+
+# Heavy packages that must never load at import time
+FORBIDDEN_PREFIXES = ("google", "streamlit", "pandas")
+
+DEFAULT_BUDGET_MS = 50.0
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_importtime(trace: str, module: str) -> dict:
+    """
+    Parses an `-X importtime` trace for a single imported module.
+
+    Children are printed before their parent, indented two spaces per
+    level, so the module's own tree is the indented lines just before
+    its top-level line. Interpreter-startup imports (site, encodings)
+    are top-level lines of their own and are left out.
+
+    Returns:
+        dict: cumulative time (ms) of the module, total import time of
+              the process (ms), slowest imports and forbidden modules
+              within the module's tree.
+    """
+    entries = []
+    for line in trace.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented name>"
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        raw_name = fields[2][1:]
+        level = (len(raw_name) - len(raw_name.lstrip(" "))) // 2
+        entries.append((raw_name.strip(), level, int(fields[0]), int(fields[1])))
+
+    process_us = sum(cum for _, level, _, cum in entries if level == 0)
+
+    index = next(
+        (i for i, (name, level, _, _) in enumerate(entries) if name == module and level == 0),
+        None,
+    )
+    if index is None:
+        return {"cumulative_ms": None, "process_ms": process_us / 1000, "forbidden": [], "slowest": []}
+
+    start = index
+    while start > 0 and entries[start - 1][1] > 0:
+        start -= 1
+    tree = entries[start:index + 1]
+
+    forbidden = sorted({
+        name for name, _, _, _ in tree
+        if name.split(".")[0] in FORBIDDEN_PREFIXES
+    })
+    slowest = sorted(tree, key=lambda e: e[2], reverse=True)[:5]
+
+    return {
+        "cumulative_ms": entries[index][3] / 1000,
+        "process_ms": process_us / 1000,
+        "forbidden": forbidden,
+        "slowest": [(name, self_us / 1000) for name, _, self_us, _ in slowest],
+    }
+
+
+def measure_import(module: str) -> dict:
+    """
+    Imports a module in a fresh interpreter and parses its importtime trace.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    report = parse_importtime(result.stderr, module)
+    report["module"] = module
+    report["error"] = result.stderr.strip().splitlines()[-1] if result.returncode != 0 else None
+    return report
+
+
+def self_check():
+    """
+    Checks the trace parser against a canned importtime trace.
+    """
+    trace = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       900 |        900 | site",
+        "import time:       100 |        100 |     google.genai",
+        "import time:       300 |        400 |   json",
+        "import time:        50 |         50 |   os",
+        "import time:       200 |        650 | run_mission",
+    ])
+    report = parse_importtime(trace, "run_mission")
+
+    assert report["cumulative_ms"] == 0.65
+    assert report["process_ms"] == 1.55
+    assert report["forbidden"] == ["google.genai"]
+    assert [name for name, _ in report["slowest"]] == ["json", "run_mission", "google.genai", "os"]
+    assert parse_importtime(trace, "missing")["cumulative_ms"] is None
+    print("✅ importtime parser self-check passed")
+
+
+def check_budget(modules, budget_ms: float) -> bool:
+    """
+    Prints an import-time report and returns True if all modules fit the budget.
+    """
+    ok = True
+    print(f"--- ⏱️ STARTUP BUDGET: {budget_ms:.1f} ms per module (interpreter startup not counted) ---")
+    for module in modules:
+        report = measure_import(module)
+
+        if report["error"]:
+            ok = False
+            print(f"❌ {module}: import failed ({report['error']})")
+            continue
+
+        within = report["cumulative_ms"] <= budget_ms and not report["forbidden"]
+        ok = ok and within
+        print(
+            f"{'✅' if within else '❌'} {module}: {report['cumulative_ms']:.1f} ms"
+            f" (process total incl. interpreter startup: {report['process_ms']:.1f} ms)"
+        )
+
+        if report["forbidden"]:
+            print(f"   forbidden imports: {', '.join(report['forbidden'])}")
+        for name, self_ms in report["slowest"]:
+            print(f"   {self_ms:7.2f} ms  {name}")
+
+    return ok
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gemini-Astra Startup Budget")
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=CORE_MODULES,
+        help="Modules to measure (default: headless core modules)"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("ASTRA_STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS)),
+        help="Maximum cumulative import time per module in ms (default: $ASTRA_STARTUP_BUDGET_MS or 50)"
+    )
+    parser.add_argument(
+        "--self-check",
+        action="store_true",
+        help="Check the importtime parser against a canned trace and exit"
+    )
+    args = parser.parse_args()
+
+    if args.self_check:
+        self_check()
+        sys.exit(0)
+
+    sys.exit(0 if check_budget(args.modules, args.budget_ms) else 1)